@@ -1,10 +1,93 @@
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
 import io
 import os
 import re
-import utide  # Library standar Oseanografi untuk Analisis Harmonik
+import sys
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from importlib import metadata
+from joblib import Memory
+
+def _solve_utide(time_vals, elev_vals, utide_version, **kwargs):
+    """
+    utide.solve dengan import tertunda (utide memuat tabel konstituen saat import).
+    utide_version tidak dipakai di sini; hanya ikut key cache agar hasil versi lama
+    tidak dipakai lagi setelah upgrade utide.
+    """
+    import utide  # Library standar Oseanografi untuk Analisis Harmonik
+    return utide.solve(time_vals, elev_vals, **kwargs)
+
+# Cache disk hasil UTide: data & parameter identik -> tidak perlu solve ulang.
+# Lokasi diatur lewat env SRGI_UTIDE_CACHE (default: ~/.cache/srgi_converter/utide);
+# isi "0"/"off"/"none" atau string kosong untuk mematikan cache.
+_UTIDE_CACHE_DIR = os.environ.get(
+    'SRGI_UTIDE_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'srgi_converter', 'utide')
+)
+if _UTIDE_CACHE_DIR.strip().lower() in ('', '0', 'off', 'none'):
+    _UTIDE_CACHE_DIR = None
+UTIDE_CACHE_MAX_BYTES = 100 * 1024**2  # Ukuran maksimum cache; entri terlama dibuang
+_utide_memory = Memory(_UTIDE_CACHE_DIR, verbose=0)
+_utide_solve = _utide_memory.cache(_solve_utide)
+
+# Jumlah baris awal yang dipindai untuk header (koordinat & nama kolom)
+HEADER_SCAN_LINES = 20
+
+# Tata letak standar file prediksi BIG (indeks baris 0-based):
+# baris 5 "Lat: <lat>  Lon: <lon>", baris 8 header kolom "Lat Lon ... z(m)"
+_BIG_COORD_LINE = 4
+_BIG_HEADER_LINE = 7
+
+# Pola koordinat header (dikompilasi sekali, dipakai ulang tiap file)
+_LON_RE = re.compile(r'Lon:\s*([-\d\.]+)')
+_LAT_RE = re.compile(r'Lat:\s*([-\d\.]+)')
+
+# Batas Longitude zona waktu Indonesia: lon < 114.8 WIB, < 129.0 WITA, sisanya WIT
+_TZ_BOUNDS = np.array([114.8, 129.0])
+_TZ_NAMES = ('WIB', 'WITA', 'WIT')
+_TZ_OFFSETS = (7, 8, 9)
+
+# Klasifikasi Wyrtki (1961): batas atas (inklusif) tiap kelas Formzahl
+_F_BOUNDS = np.array([0.0, 0.25, 1.5, 3.0])
+_F_TYPES = (
+    "Undefined",
+    "Semidiurnal (Ganda)",
+    "Mixed, prevailing semidiurnal (Campuran condong Ganda)",
+    "Mixed, prevailing diurnal (Campuran condong Tunggal)",
+    "Diurnal (Tunggal)",
+)
+
+# Batas baris sheet Data di Excel; di atas ini data lengkap dipindah ke Parquet
+EXCEL_MAX_ROWS = 50_000
+EXCEL_CHART_POINTS = 5_000
+
+# Jumlah titik maksimum grafik HTML (downsampling LTTB)
+HTML_MAX_POINTS = 5_000
+
+def _lttb_indices(x, y, n_out):
+    """Indeks titik hasil downsampling LTTB (Largest-Triangle-Three-Buckets)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 bucket di antara titik pertama & terakhir (selalu dipertahankan)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            cx, cy = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        # Pilih titik dengan luas segitiga terbesar (titik terpilih sebelumnya, kandidat, rata-rata bucket berikutnya)
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
 
 class HydroTideArchitect:
     """
@@ -28,13 +111,19 @@ class HydroTideArchitect:
         self.formzahl = 0.0 
         self.constituents = {} # Menyimpan hasil harmonik (A & g)
         self.raw_content = ""
+        self.file_path = None
+        self.header_lines = []
         
         if file_path and os.path.exists(file_path):
+            # Hanya baris header yang dibaca; body numerik dibaca langsung oleh read_csv
             with open(file_path, 'r') as f:
-                self.raw_content = f.read()
+                self.header_lines = [line.rstrip('\r\n') for line in islice(f, HEADER_SCAN_LINES)]
+            self.file_path = file_path
             self.file_name = os.path.basename(file_path)
         elif raw_data_string:
             self.raw_content = raw_data_string
+            head = raw_data_string.split('\n', HEADER_SCAN_LINES)[:HEADER_SCAN_LINES]
+            self.header_lines = [line.rstrip('\r') for line in head]
             self.file_name = "Raw_Data_Input"
         else:
             raise ValueError("Input data tidak valid.")
@@ -44,21 +133,31 @@ class HydroTideArchitect:
         self.metadata['lon'] = None
         self.metadata['lat'] = None
         
-        for line in lines[:20]: 
-            match_lon = re.search(r'Lon:\s*([\d\.]+)', line)
-            match_lat = re.search(r'Lat:\s*([-\d\.]+)', line)
-            
-            if match_lon: self.metadata['lon'] = float(match_lon.group(1))
-            if match_lat: self.metadata['lat'] = float(match_lat.group(1))
+        # Fast-path format BIG: koordinat di baris tetap, parse tanpa regex
+        try:
+            parts = lines[_BIG_COORD_LINE].split()
+            if parts[0] == 'Lat:' and parts[2] == 'Lon:':
+                self.metadata['lat'], self.metadata['lon'] = float(parts[1]), float(parts[3])
+        except (IndexError, ValueError):
+            pass
+        
+        # Fallback: pindai header dengan regex
+        if self.metadata['lon'] is None:
+            for line in lines[:HEADER_SCAN_LINES]: 
+                match_lon = _LON_RE.search(line)
+                match_lat = _LAT_RE.search(line)
+                
+                if match_lon: self.metadata['lon'] = float(match_lon.group(1))
+                if match_lat: self.metadata['lat'] = float(match_lat.group(1))
+                
+                # Berhenti begitu kedua koordinat ditemukan
+                if self.metadata['lat'] is not None and self.metadata['lon'] is not None:
+                    break
         
         lon = self.metadata['lon']
         if lon is not None:
-            if lon < 114.8:
-                self.metadata['tz_name'], self.metadata['tz_offset'] = 'WIB', 7
-            elif 114.8 <= lon < 129.0:
-                self.metadata['tz_name'], self.metadata['tz_offset'] = 'WITA', 8
-            else:
-                self.metadata['tz_name'], self.metadata['tz_offset'] = 'WIT', 9
+            idx = int(np.searchsorted(_TZ_BOUNDS, lon, side='right'))
+            self.metadata['tz_name'], self.metadata['tz_offset'] = _TZ_NAMES[idx], _TZ_OFFSETS[idx]
             
             print(f"[GEO-AI] Lokasi: {self.metadata['lat']}, {lon} | Zona: {self.metadata['tz_name']}")
         else:
@@ -68,33 +167,61 @@ class HydroTideArchitect:
 
     def process_data(self):
         """Pipeline: Parsing -> Auto-Timezone -> Cleaning"""
-        lines = self.raw_content.strip().split('\n')
+        lines = self.header_lines
         self._detect_timezone_by_coords(lines)
         
-        header_idx = 0
-        for i, line in enumerate(lines):
-            if 'Lat' in line and 'Lon' in line and 'z(m)' in line:
-                header_idx = i
-                break
+        # Fast-path format BIG: header kolom di baris tetap; jika tidak cocok, pindai
+        # HEADER_SCAN_LINES baris pertama
+        header_idx = None
+        big_header = lines[_BIG_HEADER_LINE] if len(lines) > _BIG_HEADER_LINE else ''
+        if 'Lat' in big_header and 'Lon' in big_header and 'z(m)' in big_header:
+            header_idx = _BIG_HEADER_LINE
+        else:
+            for i, line in enumerate(lines):
+                if 'Lat' in line and 'Lon' in line and 'z(m)' in line:
+                    header_idx = i
+                    break
+        
+        if header_idx is None:
+            print(f"[ERROR] Header kolom (Lat Lon ... z(m)) tidak ditemukan di {HEADER_SCAN_LINES} baris pertama.")
+            return None
         
         try:
-            data_io = io.StringIO(self.raw_content)
+            # File dibaca langsung oleh parser C (tanpa salinan string di memori)
+            data_source = self.file_path if self.file_path else io.StringIO(self.raw_content)
+            # Engine C: sep=r'\s+' ditangani tokenizer C (setara delim_whitespace)
+            # Kolom Lat/Lon per baris tidak dipakai (koordinat sudah dari header) -> dilewati
             temp_df = pd.read_csv(
-                data_io, sep=r'\s+', skiprows=header_idx + 1, header=None,
-                names=['Lat', 'Lon', 'Date', 'Time', 'elevation_m'], engine='python'
+                data_source, sep=r'\s+', skiprows=header_idx + 1, header=None,
+                names=['Lat', 'Lon', 'Date', 'Time', 'elevation_m'], engine='c',
+                usecols=['Date', 'Time', 'elevation_m'],
+                dtype={'elevation_m': np.float32}
             )
             
-            temp_df['datetime_utc'] = pd.to_datetime(temp_df['Date'] + ' ' + temp_df['Time'])
+            # Parse tanggal & jam terpisah (tanpa gabung string), cache untuk tanggal berulang
+            tanggal = pd.to_datetime(temp_df['Date'], format='%Y-%m-%d', cache=True)
+            jam = pd.to_timedelta(temp_df['Time'])
+            datetime_utc = np.asarray(tanggal + jam, dtype='datetime64[ns]')
             
             # Simpan waktu lokal untuk visualisasi
             offset = self.metadata['tz_offset']
-            temp_df['datetime_local'] = temp_df['datetime_utc'] + pd.Timedelta(hours=offset)
+            # Offset dalam nanodetik int64, dijumlahkan langsung ke view datetime64[ns]
+            offset_ns = np.int64(offset) * 3_600_000_000_000
+            datetime_local = (datetime_utc.view('i8') + offset_ns).view('datetime64[ns]')
             
             # UTide membutuhkan format waktu matplotlib date number atau datetime object
-            self.df = temp_df[['datetime_utc', 'datetime_local', 'elevation_m']].copy()
+            # Frame akhir dibangun dari array yang sudah ada (copy=False): kolom elevasi
+            # hasil read_csv dipakai langsung tanpa disalin
+            self.df = pd.DataFrame({
+                'datetime_utc': datetime_utc,
+                'datetime_local': datetime_local,
+                'elevation_m': temp_df['elevation_m'].to_numpy(),
+            }, copy=False)
             
-            # Hapus data kosong agar analisis harmonik tidak error
-            self.df.dropna(subset=['elevation_m'], inplace=True)
+            # Hapus data kosong agar analisis harmonik tidak error (dropna selalu menyalin,
+            # jadi hanya dijalankan jika memang ada NaN)
+            if self.df['elevation_m'].isna().any():
+                self.df.dropna(subset=['elevation_m'], inplace=True)
             
             print(f"[SYSTEM] Data berhasil dimuat: {len(self.df)} baris data.")
             return self.df
@@ -118,27 +245,43 @@ class HydroTideArchitect:
         time_vals = self.df['datetime_utc'] # Gunakan UTC untuk analisis
         elev_vals = self.df['elevation_m'].values
         lat_val = self.metadata['lat'] if self.metadata['lat'] else -8.0
+        target_constituents = ['M2', 'S2', 'K1', 'O1']
+
+        # Decimasi: periode M2/S2/K1/O1 12-24 jam, sampling 30 menit sudah cukup.
+        # Data resolusi penuh tetap di self.df untuk plot & export.
+        # Hanya untuk sampling seragam (toleransi 1%); record dengan gap/perubahan
+        # resolusi tidak didecimasi agar stride tidak menyebabkan aliasing.
+        if len(time_vals) > 1:
+            steps = np.diff(np.asarray(time_vals, dtype='datetime64[ns]').view('i8')) / 1e9
+            dt = float(np.median(steps))
+            uniform = np.all(np.abs(steps - dt) <= 0.01 * dt)
+            if uniform and 0 < dt < 1800:
+                stride = int(1800 // dt)
+                time_vals = time_vals.iloc[::stride]
+                elev_vals = elev_vals[::stride]
 
         # Jalankan Solver UTide
         try:
-            coef = utide.solve(
+            coef = _utide_solve(
                 time_vals, elev_vals,
+                metadata.version('utide'),
                 lat=lat_val,
+                constit=target_constituents,  # Hanya 4 konstituen Formzahl
                 nodal=True,       # Koreksi nodal (penting untuk akurasi)
-                trend=True,       # Deteksi kenaikan muka air (SLR)
+                trend=False,      # Trend tidak dipakai untuk Formzahl
                 method='ols',     # Ordinary Least Squares
-                conf_int='linear',
+                conf_int='none',  # Selang kepercayaan tidak dipakai
                 verbose=False     # Supress output bawaan utide
             )
         except Exception as e:
             print(f"[ERROR] UTide gagal: {e}")
             return
+        _utide_memory.reduce_size(bytes_limit=UTIDE_CACHE_MAX_BYTES)
 
         # Ekstrak Amplitudo Konstituen Utama
         names = coef['name'].tolist()
         amplitudes = coef['A'].tolist()
-        
-        target_constituents = ['M2', 'S2', 'K1', 'O1']
+
         found_amps = {k: 0.0 for k in target_constituents}
 
         print("[RESULT] Amplitudo Konstituen Utama:")
@@ -160,17 +303,9 @@ class HydroTideArchitect:
 
         F = self.formzahl
         
-        # Klasifikasi Wyrtki (1961)
-        if 0 < F <= 0.25:
-            self.tide_type = "Semidiurnal (Ganda)"
-        elif 0.25 < F <= 1.5:
-            self.tide_type = "Mixed, prevailing semidiurnal (Campuran condong Ganda)"
-        elif 1.5 < F <= 3.0:
-            self.tide_type = "Mixed, prevailing diurnal (Campuran condong Tunggal)"
-        elif F > 3.0:
-            self.tide_type = "Diurnal (Tunggal)"
-        else:
-            self.tide_type = "Undefined"
+        # Klasifikasi Wyrtki (1961); F <= 0 atau NaN -> Undefined
+        idx = 0 if np.isnan(F) else int(np.searchsorted(_F_BOUNDS, F, side='left'))
+        self.tide_type = _F_TYPES[idx]
             
         print("-" * 40)
         print(f"Formzahl (F) : {F:.4f}")
@@ -181,44 +316,99 @@ class HydroTideArchitect:
         """Mencari 3 hari terbaik (Spring Tide) untuk Fieldwork."""
         if self.df is None: return
 
-        daily = self.df.set_index('datetime_local').resample('D')['elevation_m'].agg(['min', 'max'])
-        daily['range'] = daily['max'] - daily['min']
-        daily['3d_range_sum'] = daily['range'].rolling(window=3).sum()
+        # Range harian via numpy reduceat, tanpa groupby/rolling pandas
+        elev = self.df['elevation_m'].values
+        day_idx = self.df['datetime_local'].values.astype('datetime64[D]').view('i8')
+        # reduceat butuh hari berurutan; data tidak urut (mis. gabungan file) diurutkan dulu
+        if not np.all(np.diff(day_idx) >= 0):
+            order = np.argsort(day_idx, kind='stable')
+            elev, day_idx = elev[order], day_idx[order]
+        starts = np.r_[0, np.flatnonzero(np.diff(day_idx)) + 1]
+        if len(starts) < 3: return
+
+        daily_range = np.maximum.reduceat(elev, starts) - np.minimum.reduceat(elev, starts)
+        range_3d = daily_range[:-2] + daily_range[1:-1] + daily_range[2:]
         
-        best_end_date = daily['3d_range_sum'].idxmax()
-        if pd.isna(best_end_date): return
+        # Hanya jendela 3 hari kalender berturut-turut (hari tanpa data memutus jendela)
+        days = day_idx[starts]
+        range_3d[days[2:] - days[:-2] != 2] = -np.inf
+        
+        best = int(np.argmax(range_3d))
+        if not np.isfinite(range_3d[best]): return
 
+        best_end_date = pd.Timestamp(days[best + 2], unit='D')
         start_date = best_end_date - pd.Timedelta(days=2)
         
         tz = self.metadata['tz_name']
         print(f"REKOMENDASI FIELDWORK ({tz}): {start_date.strftime('%d %b')} - {best_end_date.strftime('%d %b %Y')}")
-        print(f"Total Range (3 Hari): {daily.loc[best_end_date, '3d_range_sum']:.2f} m")
+        print(f"Total Range (3 Hari): {range_3d[best]:.2f} m")
 
-    def export_excel_pro(self, filename=None):
+    def export_excel_pro(self, filename=None, max_excel_rows=EXCEL_MAX_ROWS):
+        """
+        Export laporan Excel (Data + Harmonik + Grafik native).
+        Jika jumlah baris > max_excel_rows (default 50.000), data lengkap disimpan
+        ke file .parquet dan Excel hanya berisi data grafik yang diperkecil
+        (<= EXCEL_CHART_POINTS titik, LTTB) + sheet Harmonik. max_excel_rows=None
+        memaksa seluruh data tetap ditulis ke Excel.
+        """
         if self.df is None: return
         if filename is None: filename = f"Laporan_Pasut_{self.metadata['tz_name']}.xlsx"
 
-        writer = pd.ExcelWriter(filename, engine='xlsxwriter')
-        # Simpan data utama
-        self.df[['datetime_local', 'elevation_m']].to_excel(writer, sheet_name='Data', index=False)
+        data_df = self.df[['datetime_local', 'elevation_m']]
+        data_sheet = 'Data'
+        if max_excel_rows is not None and len(data_df) > max_excel_rows:
+            parquet_file = os.path.splitext(filename)[0] + '.parquet'
+            data_df.to_parquet(parquet_file, index=False)
+            print(f"[INFO] {len(data_df)} baris > {max_excel_rows}: data lengkap disimpan ke {parquet_file}")
+            # Downsampling LTTB (sama dengan grafik HTML) agar pasang/surut tertinggi tetap ada
+            waktu = data_df['datetime_local'].values
+            detik = (waktu - waktu[0]) / np.timedelta64(1, 's')
+            elevasi = data_df['elevation_m'].to_numpy(np.float64)
+            data_df = data_df.iloc[_lttb_indices(detik, elevasi, EXCEL_CHART_POINTS)]
+            data_sheet = 'Grafik'
+
+        # constant_memory: baris di-flush ke disk satu per satu (RAM tetap kecil).
+        # Mode ini wajib menulis baris berurutan, sedangkan to_excel pandas menulis
+        # per kolom (data hilang) -> baris ditulis manual lewat worksheet.
+        # strings_to_*: False -> teks ditulis apa adanya tanpa deteksi angka/formula/URL per sel
+        writer = pd.ExcelWriter(filename, engine='xlsxwriter',
+                                engine_kwargs={'options': {
+                                    'constant_memory': True,
+                                    'strings_to_numbers': False,
+                                    'strings_to_formulas': False,
+                                    'strings_to_urls': False,
+                                }})
+        workbook = writer.book
+        fmt_header = workbook.add_format({'bold': True})
+        fmt_waktu = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+
+        # Simpan data utama (atau data grafik yang diperkecil)
+        worksheet = workbook.add_worksheet(data_sheet)
+        worksheet.write_row(0, 0, ['datetime_local', 'elevation_m'], fmt_header)
+        waktu = data_df['datetime_local'].tolist()
+        # float32 -> dibulatkan agar sel Excel tidak menampilkan artefak (0.135000005)
+        elevasi = np.round(data_df['elevation_m'].to_numpy(np.float64), 6).tolist()
+        for row, (t, z) in enumerate(zip(waktu, elevasi), start=1):
+            worksheet.write_datetime(row, 0, t, fmt_waktu)
+            worksheet.write_number(row, 1, z)
         
         # Simpan Konstanta Harmonik di sheet terpisah
         if self.constituents:
-            df_const = pd.DataFrame(list(self.constituents.items()), columns=['Konstituen', 'Amplitudo (m)'])
-            df_const.loc[len(df_const)] = ['Formzahl', self.formzahl]
-            df_const.loc[len(df_const)] = ['Tipe', self.tide_type]
-            df_const.to_excel(writer, sheet_name='Harmonik', index=False)
+            ws_const = workbook.add_worksheet('Harmonik')
+            ws_const.write_row(0, 0, ['Konstituen', 'Amplitudo (m)'], fmt_header)
+            rows = list(self.constituents.items())
+            rows += [('Formzahl', self.formzahl), ('Tipe', self.tide_type)]
+            for row, values in enumerate(rows, start=1):
+                ws_const.write_row(row, 0, values)
 
         # Buat Grafik
-        workbook = writer.book
-        worksheet = writer.sheets['Data']
         chart = workbook.add_chart({'type': 'scatter', 'subtype': 'smooth'})
-        max_row = len(self.df) + 1
+        max_row = len(data_df) + 1
         
         chart.add_series({
             'name': 'Elevasi (m)',
-            'categories': ['Data', 1, 0, max_row, 0],
-            'values': ['Data', 1, 1, max_row, 1],
+            'categories': [data_sheet, 1, 0, max_row, 0],
+            'values': [data_sheet, 1, 1, max_row, 1],
             'line': {'color': '#0070C0', 'width': 1.5},
         })
         
@@ -231,15 +421,24 @@ class HydroTideArchitect:
         print(f"[SUCCESS] Excel generated: {filename}")
 
     def export_html_pro(self, filename=None):
-        if self.df is None: return
+        if self.df is None or len(self.df) == 0: return
         if filename is None: filename = f"Visualisasi_Pasut_{self.metadata['tz_name']}.html"
             
+        import plotly.graph_objects as go  # Import tertunda: hanya dibutuhkan saat export HTML
+
         tz = self.metadata['tz_name']
         
+        # Downsampling LTTB untuk tampilan (bentuk puncak/lembah tetap terjaga);
+        # data resolusi penuh tetap di Excel/Parquet
+        waktu = self.df['datetime_local'].values
+        detik = (waktu - waktu[0]) / np.timedelta64(1, 's')
+        elevasi = self.df['elevation_m'].to_numpy(np.float64)
+        idx = _lttb_indices(detik, elevasi, HTML_MAX_POINTS)
+        
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=self.df['datetime_local'],
-            y=self.df['elevation_m'],
+            x=waktu[idx],
+            y=elevasi[idx],
             mode='lines',
             fill='tozeroy', 
             name='Elevasi Air',
@@ -281,11 +480,46 @@ class HydroTideArchitect:
             hovermode="x unified"
         )
         
-        fig.write_html(filename)
+        fig.write_html(filename, include_plotlyjs='cdn', full_html=True, auto_open=False)
         print(f"[SUCCESS] HTML generated: {filename}")
 
+def run_one(path):
+    """Pipeline lengkap satu file: Parsing -> Harmonik -> Fieldwork -> Export."""
+    try:
+        architect = HydroTideArchitect(file_path=path)
+        if architect.process_data() is None:
+            return False
+
+        architect.analyze_tide_type()
+        architect.recommend_fieldwork_window()
+        # Output ditulis di samping file input (nama per file) agar proses paralel
+        # tidak saling menimpa, termasuk file bernama sama di folder berbeda
+        folder = os.path.dirname(path)
+        base = os.path.splitext(architect.file_name)[0]
+        architect.export_excel_pro(os.path.join(folder, f"Laporan_Pasut_{base}.xlsx"))
+        architect.export_html_pro(os.path.join(folder, f"Visualisasi_Pasut_{base}.html"))
+        return True
+    except Exception as e:
+        # Satu file gagal tidak boleh menghentikan seluruh batch
+        print(f"[ERROR] {path}: {e}")
+        return False
+
 # --- MAIN EXECUTION ---
 if __name__ == "__main__":
+    # Batch: python SRGI_converter.py "data/*.txt" -> tiap file diproses paralel
+    if sys.argv[1:]:
+        batch_files = sorted({p for pattern in sys.argv[1:] for p in glob.glob(pattern)
+                              if os.path.isfile(p)})
+        if not batch_files:
+            print(f"[ERROR] Tidak ada file yang cocok: {' '.join(sys.argv[1:])}")
+            sys.exit(1)
+
+        # Process (bukan Thread): UTide CPU-bound & terkena GIL
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(run_one, batch_files))
+        print(f"[SYSTEM] Batch selesai: {sum(results)}/{len(batch_files)} file berhasil.")
+        sys.exit(0 if sum(results) == len(batch_files) else 1)
+
     target_file = 'wg2pasut1-28jan.txt' 
     
     # Dummy data untuk testing (2 komponen sinus)